@@ -3,32 +3,79 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import timedelta
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, DEVICE_TYPE_NOAH
-from .api import GrowattNoahAPI
+from .const import (
+    CONFIG_REFRESH_UPDATES,
+    DOMAIN,
+    DEFAULT_SCAN_INTERVAL,
+    DEVICE_TYPE_NOAH,
+    TOKEN_SAVE_DELAY,
+    TRACEBACK_LOG_WINDOW,
+)
+from .api import (
+    GrowattNoahAPI,
+    GrowattNoahAuthError,
+    GrowattNoahConnectionError,
+    GrowattNoahError,
+    GrowattNoahLoginCooldownError,
+)
 from .models import NoahData
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
     Platform.SWITCH,
     Platform.NUMBER,
-]
+)
+
+# Known API failures: (exception types, log level, UpdateFailed message)
+_ERROR_TABLE: tuple[tuple[tuple[type[BaseException], ...], int, str], ...] = (
+    (
+        (GrowattNoahAuthError,),
+        logging.ERROR,
+        "Authentication failed - check Growatt credentials in integration settings",
+    ),
+    (
+        (GrowattNoahLoginCooldownError,),
+        logging.WARNING,
+        "Re-login deferred to avoid Growatt rate limiting - retrying automatically",
+    ),
+    (
+        (GrowattNoahConnectionError, asyncio.TimeoutError),
+        logging.WARNING,
+        "Growatt API temporarily unavailable - retrying automatically",
+    ),
+)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Growatt Noah component (runs once, before any entry)."""
+    hass.data.setdefault(DOMAIN, {})
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Growatt Noah from a config entry."""
-    
+    data = entry.data
+    username = data.get("username")
+
     # Load cached auth token so HA restarts don't trigger a fresh login
     # (repeated logins can trigger Growatt's account rate-limiter)
     _store = Store(hass, 1, f"{DOMAIN}.{entry.entry_id}.auth")
@@ -36,41 +83,59 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Only reuse token if it belongs to the same account
     cached_token = (
         stored.get("token")
-        if stored.get("username") == entry.data.get("username")
+        if stored.get("username") == username
         else None
     )
     if cached_token:
         _LOGGER.debug("Reusing cached auth token from previous session")
 
+    # In-memory copy of the persisted auth data; the Store is only written
+    # when the token actually changes, and writes are coalesced
+    auth = {"username": username, "token": cached_token}
+    save_pending = False  # a delayed write is queued and not yet done
+
+    def _auth_data() -> dict:
+        """Return the data to write, marking the queued write as done."""
+        nonlocal save_pending
+        save_pending = False
+        return dict(auth)
+
     def _save_token(token: str) -> None:
         """Persist a fresh auth token so the next restart can reuse it."""
-        hass.async_create_task(
-            _store.async_save({"username": entry.data.get("username"), "token": token})
-        )
+        nonlocal save_pending
+        if token == auth["token"]:
+            return
+        auth["token"] = token
+        save_pending = True
+        _store.async_delay_save(_auth_data, TOKEN_SAVE_DELAY)
+
+    async def _flush_token() -> None:
+        """Write a still-queued token save now instead of after the delay."""
+        if save_pending:
+            await _store.async_save(_auth_data())
 
-    # Initialize the API client for Noah 2000
+    # Initialize the API client for Noah 2000. Its session runs on Home
+    # Assistant's shared connector, which HA closes at shutdown; the session
+    # itself is closed on unload and keeps this account's cookies separate
     api_client = GrowattNoahAPI(
-        connection_type=entry.data["connection_type"],
-        device_type=entry.data.get("device_type", DEVICE_TYPE_NOAH),
-        username=entry.data.get("username"),
-        password=entry.data.get("password"),
-        device_id=entry.data.get("device_id"),
+        session=async_create_clientsession(hass, cookie_jar=aiohttp.CookieJar()),
+        connection_type=data["connection_type"],
+        device_type=data.get("device_type", DEVICE_TYPE_NOAH),
+        username=username,
+        password=data.get("password"),
+        device_id=data.get("device_id"),
         cached_token=cached_token,
         on_token_saved=_save_token,
     )
     
-    # Test the connection
-    try:
-        await api_client.async_test_connection()
-    except Exception as err:
-        _LOGGER.error("Failed to connect to Growatt Noah: %s", err)
-        raise ConfigEntryNotReady from err
+    # No separate connection test: the first refresh authenticates on its own,
+    # so testing here only cost an extra round-trip before any data arrived
     
     # Create data coordinator
     coordinator = NoahDataUpdateCoordinator(
         hass,
         api_client,
-        entry.data.get("scan_interval", DEFAULT_SCAN_INTERVAL),
+        data.get("scan_interval", DEFAULT_SCAN_INTERVAL),
     )
     
     # Fetch initial data - but don't fail setup if this fails
@@ -81,11 +146,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Continue with setup anyway, coordinator will retry automatically
     
     # Store coordinator and API client
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "api": api_client,
-        "store": _store,
+        "flush_token": _flush_token,
     }
     
     # Set up platforms
@@ -93,8 +157,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     except Exception as err:
         _LOGGER.error("Failed to set up platforms: %s", err)
-        # Clean up on failure
+        # Clean up on failure: stop the coordinator's refresh timer and
+        # debouncer before closing the session it polls through
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        await coordinator.async_shutdown()
         await api_client.async_close()
         raise ConfigEntryNotReady(f"Failed to set up platforms: {err}") from err
     
@@ -107,6 +173,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         # Clean up data
         data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Flush a pending (delayed) token write before the entry goes away;
+        # nothing is written when the token did not change
+        await data["flush_token"]()
         await data["api"].async_close()
     
     return unload_ok
@@ -124,6 +193,10 @@ class NoahDataUpdateCoordinator(DataUpdateCoordinator[NoahData]):
         """Initialize the coordinator."""
         self.api_client = api_client
         self.config: dict = {}  # Device configuration (charge limits, enable flags)
+        self._config_updates_left = 0  # updates until the config is due again
+        # Exception types already logged with a traceback, and when that set resets
+        self._logged_excs: set[str] = set()
+        self._logged_excs_reset = 0.0
 
         super().__init__(
             hass,
@@ -133,38 +206,80 @@ class NoahDataUpdateCoordinator(DataUpdateCoordinator[NoahData]):
             always_update=False,  # Only update when data actually changes
         )
     
+    async def async_request_config_refresh(self) -> None:
+        """Refetch the device config on the next (debounced) refresh."""
+        self._config_updates_left = 0
+        await self.async_request_refresh()
+
     async def _async_update_data(self) -> NoahData:
         """Update data via library."""
         try:
-            data = await self.api_client.async_get_data()
+            # Device config changes far less often than the readings, so it is
+            # only refetched every CONFIG_REFRESH_UPDATES updates (counted in
+            # updates, so it scales with the user's scan interval). Both
+            # requests are independent, so when it is due they run concurrently
+            previous_config = self.config
+            config_due = self._config_updates_left <= 0
+            if config_due:
+                data, config = await asyncio.gather(
+                    self.api_client.async_get_data(),
+                    self.api_client.async_get_config(),
+                    return_exceptions=True,
+                )
+                # Config is non-critical — don't fail if endpoint is unavailable
+                if isinstance(config, Exception):
+                    _LOGGER.debug("Device config fetch failed (non-critical): %s", config)
+                elif isinstance(config, BaseException):
+                    raise config
+                else:
+                    self.config = config
+                    self._config_updates_left = CONFIG_REFRESH_UPDATES - 1
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Config update successful: %s keys (%s)", len(self.config), ", ".join(self.config))
+                if isinstance(data, BaseException):
+                    raise data
+            else:
+                self._config_updates_left -= 1
+                data = await self.api_client.async_get_data()
 
             if data and data.system.status:
-                _LOGGER.debug("Data update successful - System status: %s", data.system.status)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Data update successful - System status: %s", data.system.status)
             else:
                 _LOGGER.warning("Received incomplete data from API")
 
-            # Also refresh device config (non-critical — don't fail if endpoint is unavailable)
-            try:
-                self.config = await self.api_client.async_get_config()
-                _LOGGER.debug("Config update successful: %s", self.config)
-            except Exception as config_err:
-                _LOGGER.debug("Device config fetch failed (non-critical): %s", config_err)
+            # Readings unchanged since the last poll: hand back the previous
+            # object so always_update=False skips notifying every entity
+            if self.data is not None and data == self.data:
+                if self.config != previous_config:
+                    # Config lives outside the coordinator data, push it explicitly
+                    self.async_update_listeners()
+                return self.data
 
             return data
 
         except Exception as err:
-            error_msg = str(err)
-            
             # Handle specific API errors with user-friendly messages
-            if "507" in error_msg:
-                _LOGGER.warning("Growatt API temporarily unavailable (Error 507) - will retry automatically")
-                raise UpdateFailed("Growatt API temporarily unavailable - retrying automatically")
-            elif "Login failed" in error_msg:
-                _LOGGER.error("Authentication failed - check credentials: %s", error_msg)
-                raise UpdateFailed("Authentication failed - check Growatt credentials in integration settings")
-            elif "timeout" in error_msg.lower():
-                _LOGGER.warning("API timeout - will retry: %s", error_msg)
-                raise UpdateFailed("API timeout - retrying automatically")
-            else:
+            for exc_types, level, user_msg in _ERROR_TABLE:
+                if isinstance(err, exc_types):
+                    _LOGGER.log(level, "%s: %s", user_msg, err)
+                    raise UpdateFailed(user_msg) from err
+
+            # API errors carry their cause in the message; anything else is
+            # unexpected and gets a full traceback, but only the first time
+            # its type shows up in a window so an outage doesn't format one
+            # on every poll
+            if isinstance(err, GrowattNoahError):
+                _LOGGER.error("API communication failed: %s", err)
+                raise UpdateFailed(f"Error communicating with API: {err}") from err
+            now = time.monotonic()
+            if now >= self._logged_excs_reset:
+                self._logged_excs.clear()
+                self._logged_excs_reset = now + TRACEBACK_LOG_WINDOW
+            err_key = type(err).__name__
+            if err_key not in self._logged_excs:
+                self._logged_excs.add(err_key)
                 _LOGGER.error("API communication failed: %s", err, exc_info=True)
-                raise UpdateFailed(f"Error communicating with API: {err}") from err
\ No newline at end of file
+            else:
+                _LOGGER.error("API communication failed: %s", err)
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
\ No newline at end of file
@@ -2,24 +2,135 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import random
+import time
 from typing import Any, Callable, Optional
 import hashlib
+from urllib.parse import urlencode
 
 import aiohttp
+from yarl import URL
 
-from .const import CONNECTION_TYPE_API, DEVICE_TYPE_NOAH, DEFAULT_TIMEOUT
+try:
+    from orjson import JSONDecodeError, loads as json_loads
+except ImportError:  # orjson ships with Home Assistant; stdlib fallback for standalone use
+    from json import JSONDecodeError, loads as json_loads
+
+from .const import (
+    CONNECTION_TYPE_API,
+    DEVICE_TYPE_NOAH,
+    DEFAULT_TIMEOUT,
+    MAX_CONCURRENT_REQUESTS,
+    WORK_MODE_NAMES,
+)
 from .models import NoahData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed once here; aiohttp uses URL objects as-is instead of re-parsing the
+# string on every request
+_LOGIN_URL = URL("https://openapi.growatt.com/newTwoLoginAPI.do")
+_NOAH_STATUS_URL = URL("https://openapi.growatt.com/noahDeviceApi/noah/getSystemStatus")
+_NOAH_INFO_URL = URL("https://openapi.growatt.com/noahDeviceApi/noah/getNoahInfo")
+_NOAH_SET_PARAMETER_URL = URL("https://openapi.growatt.com/noahDeviceApi/noah/setParameter")
+
+# Sent with every request. Content-Type applies to the pre-encoded login body
+# too, which aiohttp would otherwise post as application/octet-stream
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "application/json, text/plain, */*",
+    "Content-Type": "application/x-www-form-urlencoded",
+}
+
+# Attempts per API request: the first try plus one retry after re-login
+_MAX_ATTEMPTS = 2
+
+# Hex digits for every byte value, with Growatt's quirk applied: a '0' in the
+# first digit of a byte is replaced with 'c'
+_HEX_PAIRS = tuple(f"{b:02x}" if b > 0x0F else f"c{b:x}" for b in range(256))
+
+# Words in a failed result's msg that mean the session is no longer logged in
+_AUTH_FAILURE_WORDS = ("login", "auth")
+
+
+def _is_auth_failure(result: Any) -> bool:
+    """Return True if a decoded response is a failed result asking to log in."""
+    if not isinstance(result, dict) or result.get("result"):
+        return False
+    msg = str(result.get("msg", "")).lower()
+    return any(word in msg for word in _AUTH_FAILURE_WORDS)
+
+
+# Minimum seconds between logins; repeated logins trip Growatt's rate limiter
+_LOGIN_COOLDOWN = 60
+
+# getNoahInfo fields parsed into the coordinator config: (API field, config key)
+_NUMERIC_CONFIG_FIELDS: tuple[tuple[str, str], ...] = (
+    ("chargingSocHighLimit",  "battery_charge_limit"),
+    ("chargingSocLowLimit",   "battery_discharge_limit"),
+    ("maxChargePower",        "max_charge_power"),
+    ("maxDischargePower",     "max_discharge_power"),
+)
+_FLAG_CONFIG_FIELDS: tuple[tuple[str, str], ...] = (
+    ("chargeEnable",     "battery_charge_enable"),
+    ("dischargeEnable",  "battery_discharge_enable"),
+    ("gridExportEnable", "grid_export_enable"),
+)
+
+# Noah status fields converted on every poll: (API key, default, converter)
+_NOAH_FIELD_SPEC: tuple[tuple[str, Any, Callable[[Any], Any]], ...] = (
+    ("soc",            0, float),
+    ("chargePower",    0, float),
+    ("disChargePower", 0, float),
+    ("ppv",            0, float),  # PV power
+    ("pac",            0, float),  # AC power
+    ("eacToday",       0, float),
+    ("eacTotal",       0, float),
+    ("groplugPower",   0, float),  # External device power
+    ("otherPower",     0, float),  # Other connected devices
+    ("profitToday",    0, float),
+    ("profitTotal",    0, float),
+    ("workMode",       0, int),
+    ("status",         0, int),
+    ("batteryNum",     1, int),
+    ("groplugNum",     0, int),
+)
+
+# Map parameter names to API field names for setParameter
+_PARAMETER_MAP: dict[str, str] = {
+    "battery_charge_limit": "chargingSocHighLimit",
+    "battery_discharge_limit": "chargingSocLowLimit",
+    "max_charge_power": "maxChargePower",
+    "max_discharge_power": "maxDischargePower",
+    "battery_charge_enable": "chargeEnable",
+    "battery_discharge_enable": "dischargeEnable",
+    "grid_export_enable": "gridExportEnable",
+}
+
+
+class GrowattNoahError(Exception):
+    """Error returned by, or while talking to, the Growatt API."""
+
+
+class GrowattNoahAuthError(GrowattNoahError):
+    """Login to the Growatt API failed."""
+
+
+class GrowattNoahConnectionError(GrowattNoahError):
+    """The Growatt API could not be reached or answered with an HTTP error."""
+
+
+class GrowattNoahLoginCooldownError(GrowattNoahError):
+    """A re-login was deferred to stay clear of Growatt's rate limiter."""
+
 
 class GrowattNoahAPI:
     """Optimized API client for Growatt Noah 2000 battery system."""
     
     def __init__(
         self,
+        session: aiohttp.ClientSession,
         connection_type: str,
         device_type: str = DEVICE_TYPE_NOAH,
         username: Optional[str] = None,
@@ -42,10 +153,23 @@ class GrowattNoahAPI:
         self.device_id = device_id
         self.timeout = timeout
 
-        self._session: Optional[aiohttp.ClientSession] = None
+        # Provided by the caller (in Home Assistant: async_create_clientsession),
+        # so it runs on HA's shared connector with a cookie jar of its own
+        self._session = session
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
         self._auth_token: Optional[str] = cached_token  # Pre-seed from cache
         self._on_token_saved: Optional[Callable[[str], None]] = on_token_saved
-        self._semaphore = asyncio.Semaphore(1)  # Limit concurrent requests
+        self._login_body: Optional[bytes] = None  # Encoded login form, built on first login
+        # Bound in-flight HTTP requests to what Growatt tolerates per host
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._auth_lock = asyncio.Lock()  # Serialize logins
+        self._last_login: Optional[float] = None  # monotonic time of last attempt
+        # Bumped on every successful login. The token (user id) is the same
+        # after each login, so this is what tells a fresh cookie session apart
+        self._login_generation = 0
+        # Last raw status payload and the NoahData built from it
+        self._last_status: Optional[dict[str, Any]] = None
+        self._last_data: Optional[NoahData] = None
     
     async def async_test_connection(self) -> bool:
         """Test the connection to the Noah 2000 device."""
@@ -65,63 +189,49 @@ class GrowattNoahAPI:
                 _LOGGER.error("Authentication failed - no token received")
                 return False
                 
-        except Exception as err:
+        except GrowattNoahError as err:
             _LOGGER.error("Connection test failed: %s", err)
             return False
     
     async def async_get_data(self) -> NoahData:
         """Get Noah 2000 device data."""
-        async with self._semaphore:
-            if not self._auth_token:
-                await self._authenticate_api()
+        noah_status = await self._noah_system_status(self.device_id)
 
-            noah_status = await self._noah_system_status(self.device_id)
-            _LOGGER.debug("Noah status retrieved: %s keys", len(noah_status.keys()) if noah_status else 0)
+        # Idle periods (e.g. at night) return the same payload poll after poll;
+        # reuse the previous result instead of converting it again
+        if noah_status and noah_status == self._last_status:
+            _LOGGER.debug("Noah status unchanged, reusing previous data")
+            return self._last_data
 
-            battery_data = self._convert_noah_response(noah_status)
-            _LOGGER.debug("Converted battery data keys: %s", list(battery_data.keys()) if battery_data else "None")
+        battery_data = self._convert_noah_response(noah_status)
+        noah_data_obj = NoahData.from_api_response(battery_data)
+        self._last_status = noah_status
+        self._last_data = noah_data_obj
 
-            noah_data_obj = NoahData.from_api_response(battery_data)
+        # Runs every poll: skip building the key lists unless debug is on
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Noah status retrieved: %s keys", len(noah_status) if noah_status else 0)
+            _LOGGER.debug("Converted battery data keys: %s", list(battery_data) if battery_data else "None")
             _LOGGER.debug(
                 "NoahData created - SOC: %s, Solar: %s, Status: %s",
                 noah_data_obj.battery.soc,
                 noah_data_obj.solar.power,
                 noah_data_obj.system.status,
             )
-            return noah_data_obj
+        return noah_data_obj
     
     async def async_close(self) -> None:
-        """Close the API session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Close the API session (the connector belongs to Home Assistant)."""
+        await self._session.close()
 
     async def async_get_config(self) -> dict[str, Any]:
         """Fetch device configuration: charge limits, power limits, enable flags."""
-        if not self._auth_token:
-            await self._authenticate_api()
-
-        data = {
-            "deviceSn": self.device_id,
-            "userId": self._auth_token,
-        }
-
-        async with self._session.post(
-            "https://openapi.growatt.com/noahDeviceApi/noah/getNoahInfo",
-            data=data,
-        ) as response:
-            if response.status != 200:
-                raise Exception(f"getNoahInfo HTTP {response.status}")
-            response_text = await response.text()
-            try:
-                result = json.loads(response_text)
-            except json.JSONDecodeError as exc:
-                raise Exception(f"getNoahInfo JSON parse error: {exc}") from exc
-            if not result.get("result"):
-                raise Exception(f"getNoahInfo API error: {result.get('msg', 'Unknown')}")
-            config = self._parse_noah_config(result)
-            _LOGGER.debug("Device config fetched: %s", config)
-            return config
+        result = await self._post_json(_NOAH_INFO_URL, {"deviceSn": self.device_id})
+        if not result.get("result"):
+            raise GrowattNoahError(f"getNoahInfo API error: {result.get('msg', 'Unknown')}")
+        config = self._parse_noah_config(result)
+        _LOGGER.debug("Device config fetched: %s", config)
+        return config
 
     def _parse_noah_config(self, result: dict[str, Any]) -> dict[str, Any]:
         """Extract config fields from getNoahInfo response, handling multiple structures."""
@@ -134,15 +244,12 @@ class GrowattNoahAPI:
 
         # Battery SOC limits and power limits — may be nested or flat
         bm = obj.get("batteryManagement", obj)
+        if not isinstance(bm, dict):
+            bm = obj
 
-        for src_key, cfg_key in [
-            ("chargingSocHighLimit",  "battery_charge_limit"),
-            ("chargingSocLowLimit",   "battery_discharge_limit"),
-            ("maxChargePower",        "max_charge_power"),
-            ("maxDischargePower",     "max_discharge_power"),
-        ]:
+        for src_key, cfg_key in _NUMERIC_CONFIG_FIELDS:
             # Try nested dict first, then flat
-            val = bm.get(src_key) if isinstance(bm, dict) else None
+            val = bm.get(src_key)
             if val is None:
                 val = obj.get(src_key)
             if val is not None:
@@ -152,11 +259,7 @@ class GrowattNoahAPI:
                     pass
 
         # Enable / disable boolean flags (API sends 0/1 as int or string)
-        for src_key, cfg_key in [
-            ("chargeEnable",     "battery_charge_enable"),
-            ("dischargeEnable",  "battery_discharge_enable"),
-            ("gridExportEnable", "grid_export_enable"),
-        ]:
+        for src_key, cfg_key in _FLAG_CONFIG_FIELDS:
             val = obj.get(src_key)
             if val is not None:
                 try:
@@ -168,197 +271,195 @@ class GrowattNoahAPI:
     
     def _hash_password(self, password: str) -> str:
         """Hash password using Growatt's MD5 algorithm."""
-        password_md5 = hashlib.md5(password.encode('utf-8')).hexdigest()
-        for i in range(0, len(password_md5), 2):
-            if password_md5[i] == '0':
-                password_md5 = password_md5[0:i] + 'c' + password_md5[i + 1:]
-        return password_md5
+        digest = hashlib.md5(password.encode('utf-8')).digest()
+        return ''.join(map(_HEX_PAIRS.__getitem__, digest))
     
     async def _authenticate_api(self) -> None:
         """Authenticate with Growatt API using aiohttp (like official HA integration)."""
-        # Always ensure we have an aiohttp session (required for ALL API calls).
-        # Session creation must happen before the cached-token early-return below.
-        if not self._session:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json, text/plain, */*",
-                "Content-Type": "application/x-www-form-urlencoded",
-            }
-            cookie_jar = aiohttp.CookieJar()
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                headers=headers,
-                cookie_jar=cookie_jar,
-            )
-
         # If we already have a token (cached or from a previous login), skip re-auth.
         # The token is cleared on session-expiry so this method will be called again.
         if self._auth_token:
             return
 
-        # Hash password using Growatt's method
-        hashed_password = self._hash_password(self.password)
-        
-        login_data = {
-            "userName": self.username,
-            "password": hashed_password,
-        }
-        
-        login_url = "https://openapi.growatt.com/newTwoLoginAPI.do"
+        # Concurrent callers (status + config refresh) share a single login:
+        # whoever gets the lock logs in, the rest find the fresh token
+        async with self._auth_lock:
+            if self._auth_token:
+                return
+            # The token (user id) does not expire, only the cookie session
+            # does; a login page straight after logging in means something else
+            # is wrong, so back off instead of hammering the login endpoint
+            now = time.monotonic()
+            if self._last_login is not None and now - self._last_login < _LOGIN_COOLDOWN:
+                raise GrowattNoahLoginCooldownError("Re-login deferred to avoid Growatt rate limiting")
+            self._last_login = now
+            await self._login()
+
+    async def _login(self) -> None:
+        """Log in to the Growatt API and store the returned token."""
+        # Credentials never change for this client, so hash the password and
+        # form-encode the login body only once. Sent as bytes with the
+        # x-www-form-urlencoded Content-Type from _HEADERS
+        if self._login_body is None:
+            self._login_body = urlencode({
+                "userName": self.username,
+                "password": self._hash_password(self.password),
+            }).encode()
         
-        async with self._session.post(login_url, data=login_data) as response:
-            if response.status == 200:
-                result = await response.json()
-                login_result = result.get("back", {})
-                
-                if login_result.get("success"):
-                    self._auth_token = login_result.get("user", {}).get("id")
-                    _LOGGER.debug("Authentication successful")
-                    if self._auth_token and self._on_token_saved:
-                        self._on_token_saved(self._auth_token)
-                else:
-                    raise Exception(f"Login failed: {login_result.get('msg', 'Authentication failed')}")
-            else:
-                text = await response.text()
-                raise Exception(f"HTTP {response.status}: {text}")
+        try:
+            async with self._semaphore, self._session.post(
+                _LOGIN_URL, data=self._login_body, headers=_HEADERS, timeout=self._timeout
+            ) as response:
+                if response.status != 200:
+                    text = await response.text()
+                    raise GrowattNoahConnectionError(f"HTTP {response.status}: {text}")
+                body = await response.read()
+        except asyncio.TimeoutError as err:
+            raise GrowattNoahConnectionError("Login request timeout") from err
+        except aiohttp.ClientError as err:
+            raise GrowattNoahConnectionError(f"Login request failed: {err}") from err
+
+        try:
+            login_result = json_loads(body).get("back", {})
+        except (JSONDecodeError, AttributeError) as err:
+            raise GrowattNoahError(f"Failed to parse login response: {err}") from err
+
+        if not login_result.get("success"):
+            raise GrowattNoahAuthError(f"Login failed: {login_result.get('msg', 'Authentication failed')}")
+        self._auth_token = login_result.get("user", {}).get("id")
+        self._login_generation += 1
+        _LOGGER.debug("Authentication successful")
+        if self._auth_token and self._on_token_saved:
+            self._on_token_saved(self._auth_token)
     
     async def _noah_system_status(self, serial_number: str) -> dict[str, Any]:
         """Get Noah system status with comprehensive battery information."""
-        if not self._auth_token:
-            await self._authenticate_api()
-        
-        # The Noah API requires both the auth token and session cookies
-        data = {
-            "deviceSn": serial_number,
-            "userId": self._auth_token  # Include user ID in request
-        }
-        
-        async with self._session.post(
-            "https://openapi.growatt.com/noahDeviceApi/noah/getSystemStatus",
-            data=data,
-        ) as response:
-            if response.status != 200:
-                raise Exception(f"Failed to get Noah status: HTTP {response.status}")
-
-            # Read body once — aiohttp streams can only be consumed once
-            response_text = await response.text()
-
-            # Detect session expiry (server redirects to a login page)
-            if "login" in response_text.lower() or "jsessionid" in response_text.lower():
-                _LOGGER.warning("Session expired, re-authenticating...")
-                self._auth_token = None
-                await self._authenticate_api()
-                return await self._noah_system_status(serial_number)
+        result = await self._post_json(_NOAH_STATUS_URL, {"deviceSn": serial_number})
 
-            try:
-                result = json.loads(response_text)
-            except json.JSONDecodeError as exc:
-                raise Exception(
-                    f"Failed to parse Noah status response: {exc}; "
-                    f"body: {response_text[:200]}"
-                ) from exc
-
-            if result.get("result"):
-                noah_status = result.get("obj", {})
+        if result.get("result"):
+            noah_status = result.get("obj", {})
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("Noah system status response: %s", noah_status)
                 _LOGGER.debug(
                     "Raw Noah power values - chargePower: %s, disChargePower: %s",
                     noah_status.get("chargePower"),
                     noah_status.get("disChargePower"),
                 )
-                return noah_status
+            return noah_status
+        else:
+            raise GrowattNoahError(f"Noah status error: {result.get('msg', 'Unknown error')}")
+
+    async def _post_json(self, url: URL, data: dict[str, Any]) -> dict[str, Any]:
+        """POST a form to the Noah API and return the decoded JSON response.
+
+        The Noah API requires both the auth token and session cookies. When the
+        session has expired the server answers with its login page instead of
+        JSON, or with a failed result asking to log in again; either triggers
+        one re-login and retry after a short backoff.
+        """
+        for attempt in range(_MAX_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(2 ** (attempt - 1) + random.random())
+            if not self._auth_token:
+                await self._authenticate_api()
+            generation = self._login_generation
+
+            try:
+                async with self._semaphore, self._session.post(
+                    url,
+                    data={**data, "userId": self._auth_token},
+                    headers=_HEADERS,
+                    timeout=self._timeout,
+                ) as response:
+                    if response.status != 200:
+                        raise GrowattNoahConnectionError(f"HTTP {response.status} from {url}")
+                    # Read body once — aiohttp streams can only be consumed once.
+                    # Kept as raw bytes: the JSON parser takes them without a decode pass
+                    body = await response.read()
+            except asyncio.TimeoutError as err:
+                raise GrowattNoahConnectionError(f"Request timeout for {url}") from err
+            except aiohttp.ClientError as err:
+                raise GrowattNoahConnectionError(f"Request to {url} failed: {err}") from err
+
+            try:
+                result = json_loads(body)
+            except JSONDecodeError as exc:
+                # Detect session expiry (server redirects to a login page)
+                lowered = body.lower()
+                if b"login" not in lowered and b"jsessionid" not in lowered:
+                    raise GrowattNoahError(
+                        f"Failed to parse response from {url}: {exc}; "
+                        f"body: {body[:200].decode(errors='replace')}"
+                    ) from exc
             else:
-                raise Exception(f"Noah status error: {result.get('msg', 'Unknown error')}")
+                if not _is_auth_failure(result):
+                    return result
+            _LOGGER.warning("Session expired, re-authenticating...")
+            # A concurrent request may already have logged in again since this
+            # one was sent; only force a new login if nobody has
+            if self._login_generation == generation:
+                self._auth_token = None
+
+        raise GrowattNoahError(f"Session expired again after re-authenticating for {url}")
     
     async def async_set_noah_parameter(self, serial_number: str, parameter: str, value: Any) -> bool:
         """Set Noah configuration parameter."""
-        if not self._auth_token:
-            await self._authenticate_api()
-        
-        # Map parameter names to API field names
-        parameter_map = {
-            "battery_charge_limit": "chargingSocHighLimit",
-            "battery_discharge_limit": "chargingSocLowLimit", 
-            "max_charge_power": "maxChargePower",
-            "max_discharge_power": "maxDischargePower",
-            "battery_charge_enable": "chargeEnable",
-            "battery_discharge_enable": "dischargeEnable",
-            "grid_export_enable": "gridExportEnable",
-        }
-        
-        api_parameter = parameter_map.get(parameter)
+        api_parameter = _PARAMETER_MAP.get(parameter)
         if not api_parameter:
-            raise Exception(f"Unknown parameter: {parameter}")
-        
-        # The Noah configuration API endpoint
-        data = {
-            "deviceSn": serial_number,
-            "userId": self._auth_token,
-            api_parameter: value
-        }
+            raise ValueError(f"Unknown parameter: {parameter}")
         
-        async with self._session.post(
-            "https://openapi.growatt.com/noahDeviceApi/noah/setParameter",
-            data=data
-        ) as response:
-            if response.status == 200:
-                try:
-                    result = await response.json()
-                    if result.get("result"):
-                        _LOGGER.info("Noah parameter %s set to %s successfully", parameter, value)
-                        return True
-                    else:
-                        _LOGGER.error("Failed to set Noah parameter %s: %s", parameter, result.get('msg', 'Unknown error'))
-                        return False
-                except Exception as e:
-                    _LOGGER.error("Failed to parse Noah parameter response: %s", e)
-                    return False
-            else:
-                _LOGGER.error("Failed to set Noah parameter: HTTP %s", response.status)
-                return False
+        try:
+            result = await self._post_json(
+                _NOAH_SET_PARAMETER_URL,
+                {"deviceSn": serial_number, api_parameter: value},
+            )
+        except GrowattNoahError as e:
+            _LOGGER.error("Failed to set Noah parameter %s: %s", parameter, e)
+            return False
+
+        if result.get("result"):
+            _LOGGER.info("Noah parameter %s set to %s successfully", parameter, value)
+            return True
+        _LOGGER.error("Failed to set Noah parameter %s: %s", parameter, result.get('msg', 'Unknown error'))
+        return False
     
     def _convert_noah_response(self, noah_status: dict[str, Any]) -> dict[str, Any]:
         """Convert Noah API response to structured data format."""
         if not noah_status:
             return {}
         
-        # Convert string values to appropriate numeric types
+        # Convert string values to appropriate numeric types in one pass. Only
+        # missing fields fall back to the default: a null or empty value is a
+        # bad reading and fails the conversion rather than reporting zero
         try:
-            soc = float(noah_status.get("soc", 0))
-            charge_power = float(noah_status.get("chargePower", 0))
-            discharge_power = float(noah_status.get("disChargePower", 0))
-            solar_power = float(noah_status.get("ppv", 0))  # ppv = PV power
-            grid_power = float(noah_status.get("pac", 0))   # pac = AC power
-            work_mode = int(noah_status.get("workMode", 0))
-            status = int(noah_status.get("status", 0))
-            
-            # Validate power values are non-negative
-            charge_power = max(0, charge_power)
-            discharge_power = max(0, discharge_power)
-            solar_power = max(0, solar_power)
-            
-            _LOGGER.debug("Converted power values - charge: %s, discharge: %s, solar: %s", 
-                         charge_power, discharge_power, solar_power)
-            
-            # Additional Noah fields
-            groplug_power = float(noah_status.get("groplugPower", 0))  # External device power
-            other_power = float(noah_status.get("otherPower", 0))      # Other connected devices
-            profit_today = float(noah_status.get("profitToday", 0))   # Daily profit
-            profit_total = float(noah_status.get("profitTotal", 0))   # Total profit
-            
+            values = {
+                key: convert(noah_status.get(key, default))
+                for key, default, convert in _NOAH_FIELD_SPEC
+            }
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Error converting Noah data types: %s", e)
             return {}
         
+        # Validate power values are non-negative
+        charge_power = max(0, values["chargePower"])
+        discharge_power = max(0, values["disChargePower"])
+        solar_power = max(0, values["ppv"])
+        
+        _LOGGER.debug("Converted power values - charge: %s, discharge: %s, solar: %s", 
+                     charge_power, discharge_power, solar_power)
+        
+        grid_power = values["pac"]
+        groplug_power = values["groplugPower"]
+        other_power = values["otherPower"]
+        work_mode = values["workMode"]
+        status = values["status"]
+        
         # Map work modes to readable text
-        work_mode_map = {
-            0: "No Response",
-            1: "Load First",
-            2: "Battery First", 
-            3: "Grid First",
-            4: "Backup Mode",
-        }
-        work_mode_text = work_mode_map.get(work_mode, f"Unknown ({work_mode})")
+        work_mode_text = (
+            WORK_MODE_NAMES[work_mode]
+            if 0 <= work_mode < len(WORK_MODE_NAMES)
+            else f"Unknown ({work_mode})"
+        )
         
         # Calculate total load power including all connected devices
         # Load = Solar + Battery Discharge - Battery Charge - Grid Export + Connected Devices
@@ -366,7 +467,7 @@ class GrowattNoahAPI:
         
         return {
             # Battery fields
-            "battery_soc": soc,
+            "battery_soc": values["soc"],
             "battery_power": charge_power - discharge_power,  # Net battery power
             "battery_voltage": 0,  # Not available in Noah API
             "battery_current": 0,  # Not available in Noah API
@@ -377,8 +478,8 @@ class GrowattNoahAPI:
             "solar_power": solar_power,
             "solar_voltage": 0,  # Not available in Noah API
             "solar_current": 0,  # Not available in Noah API
-            "solar_energy_today": float(noah_status.get("eacToday", 0)),
-            "solar_energy_total": float(noah_status.get("eacTotal", 0)),
+            "solar_energy_today": values["eacToday"],
+            "solar_energy_total": values["eacTotal"],
             
             # Grid fields
             "grid_power": grid_power,
@@ -406,17 +507,17 @@ class GrowattNoahAPI:
             "charge_power": charge_power,
             "discharge_power": discharge_power,
             "work_mode": work_mode,
-            "battery_count": int(noah_status.get("batteryNum", 1)),
+            "battery_count": values["batteryNum"],
             "plant_id": noah_status.get("plantId", ""),
             "associated_inverter": noah_status.get("associatedInvSn", ""),
             
             # Economic data
-            "profit_today": profit_today,
-            "profit_total": profit_total,
+            "profit_today": values["profitToday"],
+            "profit_total": values["profitTotal"],
             "money_unit": noah_status.get("moneyUnit", "$"),
             
             # Connected devices
             "groplug_power": groplug_power,
-            "groplug_count": int(noah_status.get("groplugNum", 0)),
+            "groplug_count": values["groplugNum"],
             "other_power": other_power,
         }
\ No newline at end of file
@@ -133,7 +133,7 @@ class NoahBinarySensor(CoordinatorEntity[NoahDataUpdateCoordinator], BinarySenso
         data: NoahData = self.coordinator.data
         
         attrs = {
-            "last_update": data.timestamp.isoformat(),
+            "last_data_change": data.timestamp.isoformat(),
         }
         
         # Add specific attributes based on sensor type
@@ -4,12 +4,14 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .api import GrowattNoahAPI
 from .const import (
@@ -37,6 +39,11 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     
     # Create API client for testing
     api_client = GrowattNoahAPI(
+        # Closed in the finally below; auto_cleanup would only keep a listener
+        # (and the closed session) alive until shutdown for every attempt
+        session=async_create_clientsession(
+            hass, auto_cleanup=False, cookie_jar=aiohttp.CookieJar()
+        ),
         connection_type=CONNECTION_TYPE_API,
         device_type=DEVICE_TYPE_NOAH,
         username=data.get(CONF_USERNAME),
@@ -6,6 +6,10 @@ DOMAIN: Final = "growatt_noah"
 # Default configuration
 DEFAULT_SCAN_INTERVAL: Final = 900  # seconds (15 minutes - reduced from 30s to prevent API lockouts)
 DEFAULT_TIMEOUT: Final = 10  # seconds
+MAX_CONCURRENT_REQUESTS: Final = 2  # in-flight requests to the Growatt API
+CONFIG_REFRESH_UPDATES: Final = 4  # coordinator updates per device config (getNoahInfo) fetch
+TOKEN_SAVE_DELAY: Final = 30  # seconds to coalesce auth token writes to disk
+TRACEBACK_LOG_WINDOW: Final = 300  # seconds before a repeated error type logs its traceback again
 
 # Connection types - Only API is supported
 CONNECTION_TYPE_API: Final = "api"
@@ -13,3 +17,14 @@ CONNECTION_TYPE_API: Final = "api"
 # Device types - Only Noah 2000 is supported
 DEVICE_TYPE_NOAH: Final = "noah_2000"
 
+# Noah work modes, indexed by the API's workMode value
+WORK_MODE_NAMES: Final = (
+    "No Response",
+    "Load First",
+    "Battery First",
+    "Grid First",
+    "Backup Mode",
+)
+
+# System statuses for which the device's entities are reported unavailable
+UNAVAILABLE_STATUSES: Final = frozenset({"Offline", "Error", "Unknown"})
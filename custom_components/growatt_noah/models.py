@@ -1,7 +1,7 @@
 """Data models for Growatt Noah 2000 integration."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
@@ -64,7 +64,7 @@ class SystemData:
     firmware_version: Optional[str] = None  # Firmware version
     serial_number: Optional[str] = None  # Device serial number
     model: Optional[str] = None  # Device model
-    last_update: Optional[datetime] = None  # Last data update
+    last_update: Optional[datetime] = field(default=None, compare=False)  # When the readings last changed
     # Additional system fields
     inverter_temperature: Optional[float] = None  # Inverter temperature (°C)
     output_power_factor: Optional[float] = None  # Output power factor
@@ -90,7 +90,10 @@ class NoahData:
     grid: GridData
     load: LoadData
     system: SystemData
-    timestamp: datetime
+    # Excluded from equality so unchanged readings compare equal across polls.
+    # The coordinator keeps the previous object for an unchanged poll, so this
+    # is when the readings last changed, not when the API was last polled
+    timestamp: datetime = field(compare=False)
     
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> NoahData:
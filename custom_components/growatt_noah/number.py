@@ -13,10 +13,13 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
 from . import NoahDataUpdateCoordinator
-from .const import DOMAIN
+from .const import DOMAIN, UNAVAILABLE_STATUSES
 
 _LOGGER = logging.getLogger(__name__)
 
+_SOC_LIMIT_KEYS = frozenset({"battery_charge_limit", "battery_discharge_limit"})
+_POWER_LIMIT_KEYS = frozenset({"max_charge_power", "max_discharge_power"})
+
 # Define number entities for configuration
 NUMBERS: tuple[NumberEntityDescription, ...] = (
     NumberEntityDescription(
@@ -151,7 +154,7 @@ class NoahNumber(CoordinatorEntity[NoahDataUpdateCoordinator], NumberEntity):
             if success:
                 self.async_write_ha_state()
                 # Refresh coordinator so the new value is reflected immediately
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_request_config_refresh()
                 
                 _LOGGER.info("Successfully set %s to %s", self.entity_description.key, value)
             else:
@@ -167,7 +170,7 @@ class NoahNumber(CoordinatorEntity[NoahDataUpdateCoordinator], NumberEntity):
             super().available and 
             self.coordinator.data is not None and
             hasattr(self.coordinator.data, 'system') and
-            self.coordinator.data.system.status not in ["Offline", "Error", "Unknown"]
+            self.coordinator.data.system.status not in UNAVAILABLE_STATUSES
         )
     
     @property
@@ -177,14 +180,14 @@ class NoahNumber(CoordinatorEntity[NoahDataUpdateCoordinator], NumberEntity):
             return {}
         
         attrs = {
-            "last_update": self.coordinator.data.timestamp.isoformat(),
+            "last_data_change": self.coordinator.data.timestamp.isoformat(),
         }
         
         # Add relevant current status
-        if self.entity_description.key in ["battery_charge_limit", "battery_discharge_limit"]:
+        if self.entity_description.key in _SOC_LIMIT_KEYS:
             attrs["current_soc"] = f"{self.coordinator.data.battery.soc}%"
         
-        elif self.entity_description.key in ["max_charge_power", "max_discharge_power"]:
+        elif self.entity_description.key in _POWER_LIMIT_KEYS:
             attrs["current_power"] = f"{self.coordinator.data.battery.power} W"
         
         return attrs
\ No newline at end of file
@@ -26,11 +26,16 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
 from . import NoahDataUpdateCoordinator
-from .const import DOMAIN
+from .const import DOMAIN, UNAVAILABLE_STATUSES
 from .models import NoahData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Battery power sensors stay available whenever system data is present
+_POWER_SENSOR_KEYS = frozenset({"battery_charge_power", "battery_discharge_power"})
+# Non "system_" sensors that still carry the system diagnostic attributes
+_SYSTEM_ATTRIBUTE_KEYS = frozenset({"inverter_temperature", "power_factor", "derating_mode"})
+
 # Define all sensor entities
 SENSORS: tuple[SensorEntityDescription, ...] = (
     # Battery sensors
@@ -391,15 +396,16 @@ class NoahSensor(CoordinatorEntity[NoahDataUpdateCoordinator], SensorEntity):
             return False
             
         # For power sensors, be more lenient - they should be available if we have system data
-        if self.entity_description.key in ["battery_charge_power", "battery_discharge_power"]:
-            system_available = self.coordinator.data.system.status not in ["Error"]
-            _LOGGER.debug("Power sensor %s availability: basic=%s, system_status=%s, available=%s", 
-                         self.entity_description.key, basic_available, 
-                         self.coordinator.data.system.status, system_available)
+        if self.entity_description.key in _POWER_SENSOR_KEYS:
+            system_available = self.coordinator.data.system.status != "Error"
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Power sensor %s availability: basic=%s, system_status=%s, available=%s", 
+                             self.entity_description.key, basic_available, 
+                             self.coordinator.data.system.status, system_available)
             return system_available
         
         # For other sensors, use stricter availability
-        return self.coordinator.data.system.status not in ["Offline", "Error", "Unknown"]
+        return self.coordinator.data.system.status not in UNAVAILABLE_STATUSES
     
     @property
     def native_value(self) -> Any:
@@ -476,22 +482,26 @@ class NoahSensor(CoordinatorEntity[NoahDataUpdateCoordinator], SensorEntity):
             }
             key_mapping.update(additional_mappings)
         
-        # Debug logging to see what's happening
-        _LOGGER.debug("Sensor %s: Looking for key '%s' in data", 
-                     self.entity_description.name, self.entity_description.key)
-        _LOGGER.debug("Available keys: %s", list(key_mapping.keys()))
-        
-        # Additional debug for power sensors
-        if self.entity_description.key in ["battery_charge_power", "battery_discharge_power"]:
-            _LOGGER.debug("Power sensor debug - system.charge_power: %s, system.discharge_power: %s", 
-                         data.system.charge_power, data.system.discharge_power)
-        
         value = key_mapping.get(self.entity_description.key)
-        if value is None:
-            _LOGGER.warning("Sensor %s: No value found for key '%s'", 
-                           self.entity_description.name, self.entity_description.key)
-        else:
-            _LOGGER.debug("Sensor %s: Value = %s", self.entity_description.name, value)
+
+        # Called for every sensor on every update: only pay for the key list
+        # and formatting when debug logging is on
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sensor %s: Looking for key '%s' in data", 
+                         self.entity_description.name, self.entity_description.key)
+            _LOGGER.debug("Available keys: %s", list(key_mapping))
+            
+            # Additional debug for power sensors
+            if self.entity_description.key in _POWER_SENSOR_KEYS:
+                _LOGGER.debug("Power sensor debug - system.charge_power: %s, system.discharge_power: %s", 
+                             data.system.charge_power, data.system.discharge_power)
+            
+            if value is None:
+                # Expected for fields the Noah API does not report
+                _LOGGER.debug("Sensor %s: No value found for key '%s'", 
+                             self.entity_description.name, self.entity_description.key)
+            else:
+                _LOGGER.debug("Sensor %s: Value = %s", self.entity_description.name, value)
             
         return value
     
@@ -505,7 +515,7 @@ class NoahSensor(CoordinatorEntity[NoahDataUpdateCoordinator], SensorEntity):
         
         # Add common attributes
         attrs = {
-            "last_update": data.timestamp.isoformat(),
+            "last_data_change": data.timestamp.isoformat(),
         }
         
         # Add specific attributes based on sensor type
@@ -521,7 +531,7 @@ class NoahSensor(CoordinatorEntity[NoahDataUpdateCoordinator], SensorEntity):
             if data.solar.temperature is not None:
                 attrs["inverter_temperature"] = f"{data.solar.temperature}°C"
         
-        elif self.entity_description.key.startswith("system_") or self.entity_description.key in ["inverter_temperature", "power_factor", "derating_mode"]:
+        elif self.entity_description.key.startswith("system_") or self.entity_description.key in _SYSTEM_ATTRIBUTE_KEYS:
             if data.system.error_code is not None:
                 attrs["error_code"] = data.system.error_code
             if data.system.error_message:
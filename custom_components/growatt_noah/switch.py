@@ -12,7 +12,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
 from . import NoahDataUpdateCoordinator
-from .const import DOMAIN
+from .const import DOMAIN, UNAVAILABLE_STATUSES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -120,7 +120,7 @@ class NoahSwitch(CoordinatorEntity[NoahDataUpdateCoordinator], SwitchEntity):
             )
             
             if success:
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_request_config_refresh()
                 _LOGGER.info("Successfully turned on %s", self.entity_description.key)
             else:
                 _LOGGER.error("Failed to turn on %s", self.entity_description.key)
@@ -143,7 +143,7 @@ class NoahSwitch(CoordinatorEntity[NoahDataUpdateCoordinator], SwitchEntity):
             )
             
             if success:
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_request_config_refresh()
                 _LOGGER.info("Successfully turned off %s", self.entity_description.key)
             else:
                 _LOGGER.error("Failed to turn off %s", self.entity_description.key)
@@ -158,7 +158,7 @@ class NoahSwitch(CoordinatorEntity[NoahDataUpdateCoordinator], SwitchEntity):
             super().available and 
             self.coordinator.data is not None and
             hasattr(self.coordinator.data, 'system') and
-            self.coordinator.data.system.status not in ["Offline", "Error", "Unknown"]
+            self.coordinator.data.system.status not in UNAVAILABLE_STATUSES
         )
     
     @property
@@ -168,5 +168,5 @@ class NoahSwitch(CoordinatorEntity[NoahDataUpdateCoordinator], SwitchEntity):
             return {}
         
         return {
-            "last_update": self.coordinator.data.timestamp.isoformat(),
+            "last_data_change": self.coordinator.data.timestamp.isoformat(),
         }
\ No newline at end of file